@@ -13,7 +13,9 @@ from socha.starter import Starter
 
 
 class Logic(IClientHandler):
-    game_state: GameState
+    def __init__(self):
+        super().__init__()
+        self.game_state: Optional[GameState] = None
 
     # this method is called every time the server is requesting a new move
     # this method should always be implemented otherwise the client will be disqualified
@@ -203,6 +203,12 @@ class Board:
             int: Der Index des nächsten Vorkommens des Feldes, oder None, wenn nicht gefunden.
         """
         ...
+    def __eq__(self, other: object) -> bool: ...
+    def __hash__(self) -> int:
+        """
+        Spielbretter mit der gleichen Strecke sind gleich und haben den gleichen Hash.
+        """
+        ...
 
 class TeamEnum(Enum):
     One: int = 0
@@ -214,6 +220,14 @@ class TeamEnum(Enum):
     Team 2
     """
 
+    def opponent(self) -> TeamEnum:
+        """
+        Gibt das gegnerische Team zurück.
+
+        Returns:
+            TeamEnum: Das andere Team.
+        """
+        ...
     def __repr__(self) -> str: ...
 
 class Hare:
@@ -373,6 +387,13 @@ class Move:
         """
         ...
     def __repr__(self) -> str: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __hash__(self) -> int:
+        """
+        Gleiche Züge haben den gleichen Hash,
+        sodass sie in Sets oder als Schlüssel in einem Dictionary genutzt werden können.
+        """
+        ...
 
 class GameState:
     """
@@ -386,6 +407,10 @@ class GameState:
     board: Board
     turn: int
     last_move: Optional[Move]
+    current_team: TeamEnum
+    """
+    Das Team, das am Zug ist. Wird aus dem Zug bestimmt, ohne einen Spieler zu kopieren.
+    """
 
     def __init__(
         self, board: Board, turn: int, player_one: Hare, player_two: Hare, last_move: Optional[Move]
@@ -450,6 +475,14 @@ class GameState:
         """
         ...
 
+    def __eq__(self, other: object) -> bool: ...
+    def __hash__(self) -> int:
+        """
+        Gleiche Spielzustände haben den gleichen Hash,
+        sodass sie als Schlüssel in einem Dictionary, z.B. einer Transpositionstabelle, genutzt werden können.
+        """
+        ...
+
 class RulesEngine:
     """
     Dient zur Überprüfung der Spielregeln.
@@ -4,10 +4,13 @@ This module handles the communication with the api and the students' logic.
 
 import gc
 import logging
+import random
 import sys
 import threading
 import time
-from typing import List, Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, List, Optional, Union
 
 from socha._socha import GameState, Move
 
@@ -34,17 +37,48 @@ from socha.api.protocol.protocol import (
     Step,
 )
 
-from socha.api.networking.utils import handle_move, message_to_state
+from socha.api.networking.utils import (
+    handle_move,
+    message_to_last_move,
+    message_to_state,
+)
 from socha.api.protocol.protocol import Errorpacket
 from socha.api.protocol.protocol_packet import ProtocolPacket
 
+# The history keeps the last games only, each with a bounded number of states.
+HISTORY_GAME_LIMIT = 8
+HISTORY_ENTRY_LIMIT = 256
+
+# Seconds the client loop sleeps on the socket before it checks its state again.
+WAIT_TIMEOUT = 0.5
+
+# Time the server grants for each move, in nanoseconds.
+MOVE_TIME_LIMIT_NS = 2_000_000_000
+
+# Reconnect attempts and the limit of the exponential backoff between them, in seconds.
+RECONNECT_ATTEMPTS = 6
+RECONNECT_MAX_DELAY = 30
+
+# Messages after which the server does not send anything else on the connection.
+TERMINAL_TYPES = frozenset({Errorpacket, Left})
+
 
 class IClientHandler:
-    history: List[List[Union[GameState, Error, Result]]] = []
+    def __init__(self):
+        """
+        Subclasses that define their own constructor should call this one,
+        so every handler keeps its own history.
+        """
+        self.history: Deque[Deque[Union[GameState, Error, Result]]] = deque(
+            maxlen=HISTORY_GAME_LIMIT
+        )
+        # The time.perf_counter_ns() value by which the requested move has to be sent.
+        self.move_deadline_ns: int = 0
 
     def calculate_move(self) -> Move:
         """
         Calculates a move that the logic wants the server to perform in the game room.
+        To manage the time, compare time.perf_counter_ns() with move_deadline_ns.
         """
 
     def on_update(self, state: GameState) -> None:
@@ -168,53 +202,73 @@ class GameClient(XMLProtocolInterface):
         self.auto_reconnect = auto_reconnect
         self.survive = survive
         self.headless = headless
+        self._last_move: Optional[Move] = None
+        self._pending: Deque[ProtocolPacket] = deque()
+        # Moves are sent from a single worker, so they leave in order while the
+        # client loop already waits for the next message.
+        self._send_pool = ThreadPoolExecutor(max_workers=1)
+        self._send_error: Optional[BaseException] = None
+        self._message_handlers = {
+            Errorpacket: self._on_error_packet,
+            Joined: self._on_joined,
+            Left: self._on_left,
+            Prepared: self._on_prepared,
+            Observed: self._on_observed,
+            Room: self._on_room,
+        }
+        self._room_handlers = {
+            MoveRequest: self._on_move_request,
+            State: self._on_state,
+            Result: self._on_result,
+        }
 
     def join_game(self):
         logging.info('Joining game')
         self.send(Join())
 
     def join_game_room(self, room_id: str):
-        logging.info(f"Joining game room '{room_id}'")
+        logging.info("Joining game room '%s'", room_id)
         self.send(JoinRoom(room_id=room_id))
 
     def join_game_with_reservation(self, reservation: str):
-        logging.info(f"Joining game with reservation '{reservation}'")
+        logging.info("Joining game with reservation '%s'", reservation)
         self.send(JoinPrepared(reservation_code=reservation))
 
     def authenticate(self, password: str):
-        logging.info(f"Authenticating with password '{password}'")
+        logging.info("Authenticating with password '%s'", password)
         self.send(Authenticate(password=password))
 
     def create_game(self, player_1: Slot, player_2: Slot, game_type: str, pause: bool):
         logging.info(
-            f"Creating game with {player_1}, {player_2} and game type '{game_type}'"
+            "Creating game with %s, %s and game type '%s'", player_1, player_2, game_type
         )
         self.send(Prepare(game_type=game_type, pause=pause, slot=[player_1, player_2]))
 
     def observe(self, room_id: str):
-        logging.info(f"Observing game room '{room_id}'")
+        logging.info("Observing game room '%s'", room_id)
         self.send(Observe(room_id=room_id))
 
     def cancel(self, room_id: str):
-        logging.info(f"Cancelling game room '{room_id}'")
+        logging.info("Cancelling game room '%s'", room_id)
         self.send(Cancel(room_id=room_id))
 
     def step(self, room_id: str):
-        logging.info(f"Stepping game room '{room_id}'")
+        logging.info("Stepping game room '%s'", room_id)
         self.send(Step(room_id=room_id))
 
     def pause(self, room_id: str, pause: bool):
-        logging.info(f"Set pause of game room '{room_id}' to '{pause}'")
+        logging.info("Set pause of game room '%s' to '%s'", room_id, pause)
         self.send(Pause(room_id=room_id, pause=pause))
 
     def send_message_to_room(self, room_id: str, message):
-        logging.log(15, f"Sending message to room '{room_id}'")
-        logging.debug(f"Message is '{message}'")
+        logging.log(15, "Sending message to room '%s'", room_id)
+        logging.debug("Message is '%s'", message)
         self.send(Room(room_id=room_id, data=message))
 
     def _on_object(self, message):
         """
         Process various types of messages related to a game.
+        The handler is looked up by the exact type of the message.
 
         Args:
             message: The message object containing information about the game.
@@ -222,68 +276,103 @@ class GameClient(XMLProtocolInterface):
         Returns:
             None
         """
+        handler = self._message_handlers.get(type(message), self._on_other)
+        handler(message)
 
-        if isinstance(message, Errorpacket):
-            logging.error(f'An error occurred while handling the request: {message}')
-            self._game_handler.on_error(str(message))
-            self.stop()
-        elif isinstance(message, Joined):
-            logging.log(15, f"Game joined received with room id '{message.room_id}'")
-            self._game_handler.on_game_joined(room_id=message.room_id)
-        elif isinstance(message, Left):
-            logging.log(15, f"Game left received with room id '{message.room_id}'")
-            self._game_handler.on_game_left()
-        elif isinstance(message, Prepared):
-            logging.log(
-                15, f"Game prepared received with reservation '{message.reservation}'"
-            )
-            self._game_handler.on_prepared(
-                game_client=self,
-                room_id=message.room_id,
-                reservations=message.reservation,
-            )
-        elif isinstance(message, Observed):
-            logging.log(15, f"Game observing received with room id '{message.room_id}'")
-            self._game_handler.on_observed(game_client=self, room_id=message.room_id)
-        elif isinstance(message, Room) and not self.headless:
-            room_id = message.room_id
-            if isinstance(message.data.class_binding, MoveRequest):
-                logging.log(15, f"Move request received for room id '{room_id}'")
-                self._on_move_request(room_id)
-            elif isinstance(message.data.class_binding, State):
-                logging.log(15, f"State received for room id '{room_id}'")
-                self._on_state(message)
-            elif isinstance(message.data.class_binding, Result):
-                logging.info(f"Result received for room id '{room_id}'")
-                logging.info(f"Result was '{message.data.class_binding}'")
-                self._game_handler.history[-1].append(message.data.class_binding)
-                self._game_handler.on_game_over(message.data.class_binding)
-            else:
-                logging.log(15, f"Room message received for room id '{room_id}'")
-                self._game_handler.on_room_message(message.data.class_binding)
-        else:
-            room_id = message.room_id
-            logging.log(15, f"Room message received for room id '{room_id}'")
-            self._game_handler.on_room_message(message)
+    def _on_error_packet(self, message: Errorpacket):
+        logging.error('An error occurred while handling the request: %s', message)
+        self._game_handler.on_error(str(message))
+        self.stop()
+
+    def _on_joined(self, message: Joined):
+        logging.log(15, "Game joined received with room id '%s'", message.room_id)
+        self._game_handler.on_game_joined(room_id=message.room_id)
+
+    def _on_left(self, message: Left):
+        logging.log(15, "Game left received with room id '%s'", message.room_id)
+        self._game_handler.on_game_left()
 
-    def _on_move_request(self, room_id):
-        start_time = time.time()
+    def _on_prepared(self, message: Prepared):
+        logging.log(
+            15, "Game prepared received with reservation '%s'", message.reservation
+        )
+        self._game_handler.on_prepared(
+            game_client=self,
+            room_id=message.room_id,
+            reservations=message.reservation,
+        )
+
+    def _on_observed(self, message: Observed):
+        logging.log(15, "Game observing received with room id '%s'", message.room_id)
+        self._game_handler.on_observed(game_client=self, room_id=message.room_id)
+
+    def _on_room(self, message: Room):
+        if self.headless:
+            self._on_other(message)
+            return
+        handler = self._room_handlers.get(
+            type(message.data.class_binding), self._on_room_message
+        )
+        handler(message)
+
+    def _on_room_message(self, message: Room):
+        logging.log(15, "Room message received for room id '%s'", message.room_id)
+        self._game_handler.on_room_message(message.data.class_binding)
+
+    def _on_other(self, message):
+        logging.log(15, "Room message received for room id '%s'", message.room_id)
+        self._game_handler.on_room_message(message)
+
+    def _on_result(self, message: Room):
+        logging.info("Result received for room id '%s'", message.room_id)
+        logging.info("Result was '%s'", message.data.class_binding)
+        self._game_handler.history[-1].append(message.data.class_binding)
+        self._game_handler.on_game_over(message.data.class_binding)
+
+    def _on_move_request(self, message: Room):
+        room_id = message.room_id
+        logging.log(15, "Move request received for room id '%s'", room_id)
+        start_ns = time.perf_counter_ns()
+        self._game_handler.move_deadline_ns = start_ns + MOVE_TIME_LIMIT_NS
         move_response = self._game_handler.calculate_move()
         if move_response:
             response = handle_move(move_response)
-            logging.info(
-                f'Sent {move_response} after {round(time.time() - start_time, ndigits=3)} seconds.'
+            future = self._send_pool.submit(
+                self._send_move, room_id, response, move_response, start_ns
             )
-            self.send_message_to_room(room_id, response)
+            future.add_done_callback(self._on_send_done)
         else:
-            logging.error(f'{move_response} is not a valid move.')
+            logging.error('%s is not a valid move.', move_response)
 
-    def _on_state(self, message):
-        second_last_move = None # last move from last gamestate
-        if len(self._game_handler.history[-1]) > 0 and isinstance(self._game_handler.history[-1][-1], GameState):
-            second_last_move = self._game_handler.history[-1][-1].last_move
+    def _send_move(self, room_id: str, response, move_response, start_ns: int):
+        self.send_message_to_room(room_id, response)
+        logging.info(
+            'Sent %s after %.3f seconds.',
+            move_response,
+            (time.perf_counter_ns() - start_ns) / 1e9,
+        )
+
+    def _on_send_done(self, future):
+        """
+        Runs on the send worker, so it only records the failure; the client loop stops
+        the client on its next iteration.
+        """
+        if future.cancelled() or future.exception() is None:
+            return
+        logging.error('Sending the move failed: %s', future.exception())
+        self._send_error = future.exception()
+
+    def _drain_sends(self):
+        # The single worker runs in submission order, so once this no-op has run
+        # every move queued before it has been sent.
+        self._send_pool.submit(lambda: None).result()
+
+    def _on_state(self, message: Room):
+        logging.log(15, "State received for room id '%s'", message.room_id)
+        second_last_move = self._last_move # last move from last gamestate
 
         _state = message_to_state(message, second_last_move)
+        self._last_move = _state.last_move
         self._game_handler.history[-1].append(_state)
         self._game_handler.on_update(_state)
 
@@ -311,10 +400,52 @@ class GameClient(XMLProtocolInterface):
             self.join_game()
 
         self.first_time = False
-        self._game_handler.history.append([])
+        self._last_move = None
+        history = getattr(self._game_handler, 'history', None)
+        if history is None:
+            # Handlers whose constructor skips IClientHandler.__init__ get their history here.
+            history = self._game_handler.history = deque(maxlen=HISTORY_GAME_LIMIT)
+        history.append(deque(maxlen=HISTORY_ENTRY_LIMIT))
+
+    def _is_state(self, packet) -> bool:
+        return (
+            not self.headless
+            and type(packet) is Room
+            and type(packet.data.class_binding) is State
+        )
+
+    def _next_packet(self):
+        """
+        Returns the next packet that was already received but not handled yet,
+        or receives a new one from the server.
+        """
+        if self._pending:
+            return self._pending.popleft()
+        return self._receive()
+
+    def _coalesce_states(self, packet):
+        """
+        Skips states that are superseded by another state already waiting in the buffer,
+        so the logic is only updated with the newest one.
+        The last move of a skipped state is still kept, because the next state needs it.
+        """
+        while self._is_state(packet) and self.network_interface.has_buffered_message():
+            following = self._receive()
+            if not self._is_state(following):
+                if following is not None:
+                    self._pending.append(following)
+                break
+            logging.log(15, "Skipping superseded state for room id '%s'", packet.room_id)
+            self._last_move = message_to_last_move(packet)
+            packet = following
+        return packet
 
     def _handle_left(self):
+        # A handler may already have stopped the client, which shut the pool down.
+        if self.running:
+            self._drain_sends()
         self.first_time = True
+        self._pending.clear()
         self.network_interface.close()
         if self.survive:
             logging.info(
@@ -324,7 +455,7 @@ class GameClient(XMLProtocolInterface):
             self._game_handler.while_disconnected(player_client=self)
         if self.auto_reconnect:
             logging.info('The server left. Client tries to reconnect to the server.')
-            for _ in range(3):
+            for attempt in range(RECONNECT_ATTEMPTS):
                 logging.info('Try to establish a connection with the server...')
                 try:
                     self.connect()
@@ -336,8 +467,17 @@ class GameClient(XMLProtocolInterface):
                     logging.info(
                         "The client couldn't reconnect due to a previous error."
                     )
-                    self.stop()
-                time.sleep(1)
+                if attempt == RECONNECT_ATTEMPTS - 1:
+                    continue
+                # Backs off exponentially with jitter, so clients that lost the same
+                # server do not reconnect in lockstep.
+                time.sleep(
+                    min(RECONNECT_MAX_DELAY, 0.25 * 2**attempt) + random.uniform(0, 0.25)
+                )
+            else:
+                logging.info('The client gave up reconnecting to the server.')
+                self.stop()
+                return
             self.join()
             return
         logging.info('The server left.')
@@ -350,38 +490,50 @@ class GameClient(XMLProtocolInterface):
         """
         while_waiting = None
         while self.running:
+            if self._send_error is not None:
+                self._game_handler.on_error(str(self._send_error))
+                # The connection is broken, so it is closed without sending a goodbye.
+                self.network_interface.close()
+                self.stop()
+                break
             if self.network_interface.connected:
-                response = self._receive()
+                if not self._pending and not self.network_interface.wait(WAIT_TIMEOUT):
+                    continue
+                response = self._next_packet()
                 if not response:
                     continue
                 elif isinstance(response, ProtocolPacket):
-                    logging.debug(f'Received new object: {response}')
+                    logging.debug('Received new object: %s', response)
+                    response = self._coalesce_states(response)
                     if while_waiting:
                         while_waiting.join(timeout=0.0)
-                    if isinstance(response, Left):
+                    terminal = type(response) in TERMINAL_TYPES
+                    if type(response) is Left:
                         self._game_handler.on_game_left()
                         self._handle_left()
                     else:
                         self._on_object(response)
-                    while_waiting = threading.Thread(
-                        target=self._game_handler.while_waiting
-                    )
-                    while_waiting.start()
-                    gc.collect()
+                    if not terminal or self.running:
+                        while_waiting = threading.Thread(
+                            target=self._game_handler.while_waiting
+                        )
+                        while_waiting.start()
+                    gc.collect(generation=0)
                 elif self.running:
-                    logging.error(f'Received a object of unknown class: {response}')
+                    logging.error('Received a object of unknown class: %s', response)
                     raise NotImplementedError('Received object of unknown class.')
             else:
                 self._game_handler.while_disconnected(player_client=self)
 
         logging.info('Done.')
-        sys.exit(0)
+        sys.exit(0 if self._send_error is None else 1)
 
     def stop(self):
         """
         Disconnects from the server and stops the client loop.
         """
         logging.info('Shutting down...')
+        self._send_pool.shutdown(wait=True)
         if self.network_interface.connected:
             self.disconnect()
         self.running = False
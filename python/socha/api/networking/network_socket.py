@@ -1,7 +1,15 @@
 import logging
 import re
+import selectors
 import socket
-from typing import Union
+from typing import Optional, Union
+
+RECEIVE_SIZE = 16129
+RECEIVE_BUFFER_SIZE = 1 << 20
+
+MESSAGE_PATTERN = re.compile(
+    rb"<((room[\s\S]+?</room>)|(errorpacket[\s\S]+?</errorpacket>)|(prepared[\s\S]+?</prepared>)|(joined|left|join|observe|pause|step|cancel|creatGame|authenticate)[\s\S]*?/>)"
+)
 
 
 class NetworkSocket:
@@ -20,14 +28,23 @@ class NetworkSocket:
             timeout (float): The timeout for socket operations, in seconds. Defaults to 0.1.
             connected (bool): Whether the socket is currently connected to the server.
             socket (socket.socket): The underlying socket object.
-            buffer (bytes): A buffer for storing received data.
+            selector (selectors.BaseSelector): Waits until the socket becomes readable.
+            buffer (bytearray): A buffer for storing received data.
+            chunk (bytearray): A preallocated buffer the socket reads into, reused for every read.
+            _match (Optional[re.Match]): The first complete message found by the last search of the buffer.
+            _match_length (int): The buffer length at that search, or -1 if it has to be repeated.
         """
         self.host = host
         self.port = port
         self.timeout = timeout
         self.connected = False
         self.socket = None
-        self.buffer = b""
+        self.selector = None
+        self.buffer = bytearray()
+        self.chunk = bytearray(RECEIVE_SIZE)
+        self._chunk_view = memoryview(self.chunk)
+        self._match: Optional[re.Match] = None
+        self._match_length = -1
 
     def connect(self):
         """
@@ -35,20 +52,28 @@ class NetworkSocket:
         Sets the timeout value and sets the 'connected' attribute to True.
         """
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECEIVE_BUFFER_SIZE)
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         self.socket.settimeout(self.timeout)
         self.socket.connect((self.host, self.port))
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.socket, selectors.EVENT_READ)
         self.connected = True
 
     def close(self):
         """
         Closes the socket and sets the 'connected' attribute to False.
         """
+        if self.selector:
+            self.selector.close()
         self.socket.close()
         self.connected = False
 
     def send(self, data: bytes):
         """
         Sends the specified data (in bytes) to the connected server.
+        Each packet is passed in one piece, and Nagle's algorithm is disabled on connect,
+        so it leaves immediately instead of waiting for outstanding acknowledgements.
         """
         self.socket.sendall(data)
 
@@ -57,26 +82,68 @@ class NetworkSocket:
         Attempts to receive data from the server. The received data is processed using a regular expression to extract
         complete messages. If a complete message is found, it is returned as bytes and removed from the buffer.
         If no complete message is found, None is returned.
+        A message that is already complete in the buffer is returned without reading from the socket.
+        As long as the socket fills the whole chunk without completing a message, reading continues.
 
         If a timeout occurs or a connection reset error is encountered, the socket is closed and None is returned.
         """
-        regex = re.compile(
-            rb"<((room[\s\S]+?</room>)|(errorpacket[\s\S]+?</errorpacket>)|(prepared[\s\S]+?</prepared>)|(joined|left|join|observe|pause|step|cancel|creatGame|authenticate)[\s\S]*?/>)"
-        )
+        message = self._pop_message()
+        if message is not None:
+            return message
+
         while True:
             try:
-                chunk = self.socket.recv(16129)
+                received = self.socket.recv_into(self._chunk_view)
             except socket.timeout:
-                chunk = b""
+                received = 0
             except ConnectionResetError:
                 self.close()
                 return None
-            if chunk:
-                logging.debug(f"Received message: {chunk}")
+            if received:
+                chunk = self._chunk_view[:received]
+                if logging.root.isEnabledFor(logging.DEBUG):
+                    logging.debug("Received message: %s", bytes(chunk))
                 self.buffer += chunk
-            if regex.search(self.buffer):
-                receive = regex.search(self.buffer).group()
-                self.buffer = self.buffer.replace(receive, b"")
-                return receive
-            else:
-                return None
+            message = self._pop_message()
+            # A completely filled chunk means that more data is already waiting,
+            # so it is read right away instead of in the next call.
+            if message is not None or received < len(self.chunk):
+                return message
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Blocks until a message is waiting in the buffer or the socket has data to read,
+        but at most for the given timeout in seconds.
+
+        Returns:
+            bool: True if receiving can continue without blocking, False if the timeout expired.
+        """
+        return self.has_buffered_message() or bool(self.selector.select(timeout))
+
+    def has_buffered_message(self) -> bool:
+        """
+        Checks whether a complete message is already waiting in the buffer.
+        """
+        return self._find_message() is not None
+
+    def _find_message(self) -> Optional[re.Match]:
+        """
+        Searches the buffer for the first complete message. The result is kept until the buffer changes,
+        so checking for a message and popping it afterwards only scans the buffer once.
+        """
+        if self._match_length != len(self.buffer):
+            self._match = MESSAGE_PATTERN.search(self.buffer)
+            self._match_length = len(self.buffer)
+        return self._match
+
+    def _pop_message(self) -> Union[bytes, None]:
+        """
+        Removes the first complete message from the buffer and returns it, or None if there is none.
+        """
+        match = self._find_message()
+        if match:
+            message = bytes(match.group())
+            del self.buffer[match.start():match.end()]
+            self._match_length = -1
+            return message
+        return None
@@ -1,5 +1,6 @@
+import functools
 import re
-from typing import List
+from typing import List, Optional, Tuple
 from socha import _socha
 from socha.api.protocol.protocol import (
     Board,
@@ -10,37 +11,49 @@ from socha.api.protocol.protocol import (
 )
 
 
+FIELD_TYPES = {
+    'START': _socha.Field.Start,
+    'MARKET': _socha.Field.Market,
+    'HARE': _socha.Field.Hare,
+    'HEDGEHOG': _socha.Field.Hedgehog,
+    'CARROTS': _socha.Field.Carrots,
+    'POSITION_1': _socha.Field.Position1,
+    'POSITION_2': _socha.Field.Position2,
+    'SALAD': _socha.Field.Salad,
+    'GOAL': _socha.Field.Goal,
+}
+
+CARD_TYPES = {
+    'EAT_SALAD': _socha.Card.EatSalad,
+    'HURRY_AHEAD': _socha.Card.HurryAhead,
+    'FALL_BACK': _socha.Card.FallBack,
+    'SWAP_CARROTS': _socha.Card.SwapCarrots,
+}
+
+CARD_NAME_PATTERN = re.compile(r'[^A-Za-z0-9_]')
+
+
 def map_board(protocol_board: Board) -> _socha.Board:
     """
     Converts a protocol Board to a usable game board for using in the logic.
+    The board does not change during a game, so the last converted boards are reused.
     :param protocol_board: A Board object in protocol format
     :type protocol_board: Board
     :return: A Board object in the format used by the game logic
     :rtype: penguins.Board
     """
+    return _map_track(tuple(protocol_board.field_value))
+
+
+@functools.lru_cache(maxsize=4)
+def _map_track(fields: Tuple[str, ...]) -> _socha.Board:
     track: List[_socha.Field] = []
 
-    for field in protocol_board.field_value:
-        if field == 'START':
-            track.append(_socha.Field.Start)
-        elif field == 'MARKET':
-            track.append(_socha.Field.Market)
-        elif field == 'HARE':
-            track.append(_socha.Field.Hare)
-        elif field == 'HEDGEHOG':
-            track.append(_socha.Field.Hedgehog)
-        elif field == 'CARROTS':
-            track.append(_socha.Field.Carrots)
-        elif field == 'POSITION_1':
-            track.append(_socha.Field.Position1)
-        elif field == 'POSITION_2':
-            track.append(_socha.Field.Position2)
-        elif field == 'SALAD':
-            track.append(_socha.Field.Salad)
-        elif field == 'GOAL':
-            track.append(_socha.Field.Goal)
-        else:
-            raise ValueError(f'Unknown field type: {field}')
+    for field in fields:
+        try:
+            track.append(FIELD_TYPES[field])
+        except KeyError:
+            raise ValueError(f'Unknown field type: {field}') from None
 
     return _socha.Board(track=track)
 
@@ -59,39 +72,74 @@ def map_card_to_string(card: _socha.Card) -> str:
 
 
 def map_string_to_card(card: str) -> _socha.Card:
-    card = re.sub(r'[^A-Za-z0-9_]', '', card)
-
-    if card == 'EAT_SALAD':
-        return _socha.Card.EatSalad
-    elif card == 'HURRY_AHEAD':
-        return _socha.Card.HurryAhead
-    elif card == 'FALL_BACK':
-        return _socha.Card.FallBack
-    elif card == 'SWAP_CARROTS':
-        return _socha.Card.SwapCarrots
-    else:
-        raise ValueError(f'Unknown card type: {card}')
+    try:
+        return CARD_TYPES[card]
+    except KeyError:
+        pass
+
+    card = CARD_NAME_PATTERN.sub('', card)
+
+    try:
+        return CARD_TYPES[card]
+    except KeyError:
+        raise ValueError(f'Unknown card type: {card}') from None
 
 
 def handle_move(move_response: _socha.Move) -> Data:
+    """
+    Converts a move into the protocol data that is sent to the server.
+    Moves with the same action and values share one cached Data object,
+    which is only read by the serializer and must not be changed.
+    """
     if isinstance(move_response.action, _socha.Advance):
         advance: _socha.Advance = move_response.action
-        return Data(
-            class_value='advance',
+        return _move_data(
+            'advance',
             distance=advance.distance,
-            card=[map_card_to_string(card) for card in advance.cards],
+            cards=tuple(map_card_to_string(card) for card in advance.cards),
         )
     elif isinstance(move_response.action, _socha.EatSalad):
-        return Data(class_value='eatsalad')
+        return _move_data('eatsalad')
     elif isinstance(move_response.action, _socha.ExchangeCarrots):
         exchangeCarrots: _socha.ExchangeCarrots = move_response.action
-        return Data(class_value='exchangecarrots', amount=exchangeCarrots.amount)
+        return _move_data('exchangecarrots', amount=exchangeCarrots.amount)
     elif isinstance(move_response.action, _socha.FallBack):
-        return Data(class_value='fallback')
+        return _move_data('fallback')
     else:
         raise ValueError(f'Unknown move response action: {move_response.action}')
 
 
+@functools.lru_cache(maxsize=256)
+def _move_data(
+    class_value: str,
+    distance: Optional[int] = None,
+    cards: Optional[Tuple[str, ...]] = None,
+    amount: Optional[int] = None,
+) -> Data:
+    return Data(
+        class_value=class_value,
+        distance=distance,
+        card=list(cards) if cards is not None else None,
+        amount=amount,
+    )
+
+
+def message_to_last_move(message: Room) -> Optional[_socha.Move]:
+    """
+    Extracts the last move of the state in the provided message.
+
+    Args:
+        message: The input message containing the game state.
+
+    Returns:
+        The last move of the state, or None if no move has been made yet.
+    """
+    state: State = message.data.class_binding
+    if state.last_move and state.last_move.class_binding:
+        return _socha.Move(action=state.last_move.class_binding)
+    return None
+
+
 def message_to_state(message: Room, second_last_move: _socha.Move) -> _socha.GameState:
     """
     Constructs a GameState from the provided message, ensuring to reflect the
@@ -109,22 +157,14 @@ def message_to_state(message: Room, second_last_move: _socha.Move) -> _socha.Gam
     state: State = message.data.class_binding
 
     # extract last move of current gameState
-    state_last_move = _socha.Move(action=state.last_move.class_binding) if state.last_move and state.last_move.class_binding else None
+    state_last_move = message_to_last_move(message)
+
+    # ONE is at turn on even turns, so the last move was made by the other team
+    team_at_turn = ('ONE', 'TWO')[state.turn & 1]
 
     def create_hare(hare: Hare) -> _socha.Hare:
 
-        players_last_move = None
-
-        if state.turn % 2 == 0: # now is ONE at turn, last turn was None or TWO
-            if hare.team == 'ONE':
-                players_last_move = second_last_move
-            else:
-                players_last_move = state_last_move
-        else:
-            if hare.team == 'TWO':
-                players_last_move = second_last_move
-            else:
-                players_last_move = state_last_move
+        players_last_move = second_last_move if hare.team == team_at_turn else state_last_move
 
         return _socha.Hare(
             cards=[map_string_to_card(card) for card in hare.cards.card]
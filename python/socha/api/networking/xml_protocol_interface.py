@@ -106,7 +106,7 @@ class XMLProtocolInterface:
             handler=XmlEventHandler, context=context, config=deserialize_config
         )
 
-        serialize_config = SerializerConfig(pretty_print=True, xml_declaration=False)
+        serialize_config = SerializerConfig(pretty_print=False, xml_declaration=False)
         self.serializer = XmlSerializer(config=serialize_config)
 
     def connect(self):
@@ -16,7 +16,7 @@ from socha.api.protocol.room_message import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Board:
     class Meta:
         name = 'board'
@@ -31,7 +31,7 @@ class Board:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Cards:
     class Meta:
         name = 'cards'
@@ -45,7 +45,7 @@ class Cards:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class LastAction:
     class Meta:
         name = 'lastAction'
@@ -80,7 +80,7 @@ class LastAction:
     value: str = field(default='')
 
 
-@dataclass
+@dataclass(slots=True)
 class LastMove:
     class Meta:
         name = 'lastMove'
@@ -114,7 +114,7 @@ class LastMove:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Hare:
     class Meta:
         name = 'hare'
@@ -163,7 +163,7 @@ class Hare:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     class Meta:
         name = 'player'
@@ -177,7 +177,7 @@ class Player:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class State(ObservableRoomMessage):
     class Meta:
         name = 'state'
@@ -228,7 +228,7 @@ class State(ObservableRoomMessage):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class OriginalRequest(ProtocolPacket):
     class Meta:
         name = 'originalRequest'
@@ -249,7 +249,7 @@ class OriginalRequest(ProtocolPacket):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Errorpacket(ProtocolPacket):
     class Meta:
         name = 'errorpacket'
@@ -269,7 +269,7 @@ class Errorpacket(ProtocolPacket):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Left(ProtocolPacket):
     """
     If the game is over the server will _send this message to the clients and closes the connection afterward.
@@ -287,14 +287,14 @@ class Left(ProtocolPacket):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class MoveRequest(RoomMessage):
     """
     Request a client to _send a Move.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class Close(ProtocolPacket):
     """
     Is sent by one party immediately before this party closes the communication connection and should make the
@@ -307,7 +307,7 @@ class Close(ProtocolPacket):
         name = 'close'
 
 
-@dataclass
+@dataclass(slots=True)
 class Authenticate(AdminLobbyRequest):
     """
     Authenticates a client as administrator to _send AdminLobbyRequest`s.
@@ -325,7 +325,7 @@ class Authenticate(AdminLobbyRequest):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Cancel(AdminLobbyRequest):
     """
     Deletes the GameRoom and cancels the Game within.
@@ -343,7 +343,7 @@ class Cancel(AdminLobbyRequest):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class JoinedGameRoom(ObservableRoomMessage):
     """
     Sent to all administrative clients after a player joined a GameRoom via a JoinRoomRequest.
@@ -368,7 +368,7 @@ class JoinedGameRoom(ObservableRoomMessage):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Observe(AdminLobbyRequest):
     """
     Sent to client as response to successfully joining a GameRoom as Observer.
@@ -386,7 +386,7 @@ class Observe(AdminLobbyRequest):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Pause(AdminLobbyRequest):
     """
     Indicates to observers that the game has been (un)paused.
@@ -410,7 +410,7 @@ class Pause(AdminLobbyRequest):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Slot(RoomOrchestrationMessage):
     """
     Slots for a game which contains the player's name and its attributes.
@@ -441,7 +441,7 @@ class Slot(RoomOrchestrationMessage):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Step(RoomOrchestrationMessage):
     """
     When the client is authenticated as administrator,
@@ -461,7 +461,7 @@ class Step(RoomOrchestrationMessage):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Prepare(RoomOrchestrationMessage):
     """
     When the client is authenticated as administrator,
@@ -492,7 +492,7 @@ class Prepare(RoomOrchestrationMessage):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Join(LobbyRequest):
     """
     Joins any room that is open.
@@ -504,7 +504,7 @@ class Join(LobbyRequest):
         name = 'join'
 
 
-@dataclass
+@dataclass(slots=True)
 class JoinPrepared(LobbyRequest):
     """
     Join a prepared room with a reservation code.
@@ -522,7 +522,7 @@ class JoinPrepared(LobbyRequest):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class JoinRoom(LobbyRequest):
     """
     To join a room with a `room_id`.
@@ -540,7 +540,7 @@ class JoinRoom(LobbyRequest):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Fragment:
     """
     This holds the fragments of a winning definition.
@@ -570,7 +570,7 @@ class Fragment:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Joined(ResponsePacket):
     """
     Sent to all clients after a player joined a GameRoom via a Join Request.
@@ -588,7 +588,7 @@ class Joined(ResponsePacket):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Score:
     """
     Score of the players when the game has ended.
@@ -606,7 +606,7 @@ class Score:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Winner:
     class Meta:
         name = 'winner'
@@ -634,7 +634,7 @@ class Winner:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Definition:
     """
     The definition of a result of a game.
@@ -653,7 +653,7 @@ class Definition:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Entry:
     """
     Is _send when a game is won by one of the players.
@@ -677,7 +677,7 @@ class Entry:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Scores:
     """
     Then result of a game when its over.
@@ -694,7 +694,7 @@ class Scores:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class WelcomeMessage(RoomOrchestrationMessage):
     """
     Welcome message is sent to the client when the client joins the room.
@@ -704,7 +704,7 @@ class WelcomeMessage(RoomOrchestrationMessage):
     team: TeamEnum
 
 
-@dataclass
+@dataclass(slots=True)
 class Result(ObservableRoomMessage):
     """
     Result of a game.
@@ -716,7 +716,7 @@ class Result(ObservableRoomMessage):
     winner: Winner
 
 
-@dataclass
+@dataclass(slots=True)
 class OriginalMessage:
     """
     The original message that was sent by the client.
@@ -749,7 +749,7 @@ class OriginalMessage:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Error:
     """
     This sends the server when the client sent a erroneous message.
@@ -759,7 +759,7 @@ class Error:
     originalMessage: OriginalMessage
 
 
-@dataclass
+@dataclass(slots=True)
 class Data:
     class Meta:
         name = 'data'
@@ -830,7 +830,7 @@ class Data:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Room(ProtocolPacket):
     class Meta:
         name = 'room'
@@ -852,7 +852,7 @@ class Room(ProtocolPacket):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Observed(RoomOrchestrationMessage):
     class Meta:
         name = 'observed'
@@ -866,7 +866,7 @@ class Observed(RoomOrchestrationMessage):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Prepared(RoomOrchestrationMessage):
     class Meta:
         name = 'prepared'
@@ -886,7 +886,7 @@ class Prepared(RoomOrchestrationMessage):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Protocol:
     """
     This is the root element of the protocol.
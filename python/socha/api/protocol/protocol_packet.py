@@ -1,10 +1,14 @@
-class ProtocolPacket: ...
+class ProtocolPacket:
+    __slots__ = ()
 
 
-class LobbyRequest(ProtocolPacket): ...
+class LobbyRequest(ProtocolPacket):
+    __slots__ = ()
 
 
-class AdminLobbyRequest(LobbyRequest): ...
+class AdminLobbyRequest(LobbyRequest):
+    __slots__ = ()
 
 
-class ResponsePacket(ProtocolPacket): ...
+class ResponsePacket(ProtocolPacket):
+    __slots__ = ()
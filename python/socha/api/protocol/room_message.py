@@ -6,7 +6,7 @@ class RoomMessage(ProtocolPacket):
     For all communication within a GameRoom.
     """
 
-    ...
+    __slots__ = ()
 
 
 class RoomOrchestrationMessage(RoomMessage):
@@ -14,7 +14,7 @@ class RoomOrchestrationMessage(RoomMessage):
     A RoomMessage that does not concern the progress of the game.
     """
 
-    ...
+    __slots__ = ()
 
 
 class ObservableRoomMessage(RoomMessage):
@@ -22,4 +22,4 @@ class ObservableRoomMessage(RoomMessage):
     A RoomMessage that can be received by observers.
     """
 
-    ...
+    __slots__ = ()
@@ -4,6 +4,7 @@ This is the main entry point for the SoCha application.
 
 import argparse
 import datetime
+import gc
 import json
 import logging
 import urllib.request
@@ -18,6 +19,8 @@ class Starter:
     When this is called, the client will try to connect to the server and join a game.
     When successful, the client will start the loop and call the on_update and calculate_move methods,
     if the server sends updates.
+    Because it owns the whole process, it also tunes the garbage collector for the run,
+    see _tune_gc.
     """
 
     def __init__(
@@ -109,8 +112,21 @@ class Starter:
 
         self.client.join()
 
+        self._tune_gc()
         self.client.start()
 
+    @staticmethod
+    def _tune_gc():
+        """
+        Everything allocated so far lives for the whole run, so it is moved out of
+        the collector's reach. The raised thresholds keep young-generation sweeps
+        rare while the game states pile up.
+        This changes the collector for the whole interpreter, which is why only the
+        entry point does it and not the GameClient.
+        """
+        gc.freeze()
+        gc.set_threshold(50000, 50, 50)
+
     def _setup_debugger(self, verbose: bool, log_level: int):
         if verbose:
             level: int = logging.DEBUG
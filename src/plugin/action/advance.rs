@@ -24,7 +24,7 @@ impl Advance {
     pub fn perform(&self, state: &mut GameState) -> Result<(), PyErr> {
         let mut player = state.clone_current_player();
 
-        player.advance_by(state, self.distance, self.cards.clone())?;
+        player.advance(state, self.distance, !self.cards.is_empty())?;
 
         let current_field = state.board.get_field(player.position).unwrap();
         if self.cards.is_empty() {
@@ -35,12 +35,12 @@ impl Card {
         cards: Vec<Card>,
     ) -> Result<(), PyErr> {
         let distance = target_position as isize - player.position as isize;
-        RulesEngine::can_move_to(
+        RulesEngine::check_move_to(
             &state.board,
             distance,
             player,
-            &state.clone_other_player(),
-            cards,
+            state.other_player(),
+            !cards.is_empty(),
         )?;
 
         player.position = (player.position as isize + distance) as usize;
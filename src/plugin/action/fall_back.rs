@@ -2,7 +2,7 @@ use pyo3::*;
 
 use crate::plugin::game_state::GameState;
 
-#[pyclass]
+#[pyclass(frozen)]
 #[derive(Debug, Clone, PartialEq, Eq, PartialOrd, Hash, Default)]
 pub struct FallBack {}
 
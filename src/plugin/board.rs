@@ -1,12 +1,16 @@
+use std::collections::hash_map::DefaultHasher;
+use std::hash::{Hash, Hasher};
+use std::sync::Arc;
+
 use pyo3::*;
 
 use super::field::Field;
 
-#[pyclass]
+#[pyclass(frozen)]
 #[derive(PartialEq, Eq, PartialOrd, Clone, Debug, Hash)]
 pub struct Board {
-    #[pyo3(get)]
-    pub track: Vec<Field>,
+    /// The track never changes during a game, so cloned states share it.
+    pub track: Arc<[Field]>,
 }
 
 #[pymethods]
@@ -15,7 +19,14 @@ impl Board {
     #[new]
     #[must_use]
     pub fn new(track: Vec<Field>) -> Self {
-        Self { track }
+        Self {
+            track: track.into(),
+        }
+    }
+
+    #[getter]
+    pub fn track(&self) -> Vec<Field> {
+        self.track.to_vec()
     }
 
     /// Returns the field at the specified index, or `None` if the index is out of bounds.
@@ -25,7 +36,12 @@ impl Board {
 
     /// Finds the index of the specified field within the given range.
     pub fn find_field(&self, field: Field, start: usize, end: usize) -> Option<usize> {
-        (start..=end).find(|&i| self.track.get(i) == Some(&field))
+        let end = end.min(self.track.len().checked_sub(1)?);
+        self.track
+            .get(start..=end)?
+            .iter()
+            .position(|&f| f == field)
+            .map(|i| i + start)
     }
 
     /// Finds the previous occurrence of the specified field before the given index.
@@ -45,11 +61,21 @@ impl Board {
     pub fn __repr__(&self) -> String {
         format!("{:?}", self)
     }
+
+    pub fn __eq__(&self, other: &Board) -> bool {
+        self == other
+    }
+
+    pub fn __hash__(&self) -> u64 {
+        let mut hasher = DefaultHasher::new();
+        self.hash(&mut hasher);
+        hasher.finish()
+    }
 }
 
 impl std::fmt::Display for Board {
     fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
-        for field in &self.track {
+        for field in self.track.iter() {
             write!(f, "{}", field)?;
         }
         Ok(())
@@ -2,7 +2,7 @@ use pyo3::*;
 
 use super::action::card::Card;
 
-#[pyclass]
+#[pyclass(frozen)]
 pub struct PluginConstants;
 
 #[pymethods]
@@ -1,7 +1,14 @@
+use std::cell::RefCell;
+use std::collections::hash_map::DefaultHasher;
+use std::collections::HashMap;
+use std::hash::{Hash, Hasher};
+use std::rc::Rc;
+
 use itertools::Itertools;
 use pyo3::*;
 
 use super::action::advance::Advance;
+use super::action::card::Card;
 use super::action::eat_salad::EatSalad;
 use super::action::exchange_carrots::ExchangeCarrots;
 use super::action::fall_back::FallBack;
@@ -9,8 +16,60 @@ use super::action::Action;
 use super::board::Board;
 use super::constants::PluginConstants;
 use super::field::Field;
-use super::hare::Hare;
+use super::hare::{Hare, TeamEnum};
 use super::r#move::Move;
+use super::rules_engine::RulesEngine;
+
+const CARD_SEQUENCE_CACHE_LIMIT: usize = 1024;
+
+type CardSequences = Rc<[Vec<Card>]>;
+
+thread_local! {
+    // the same hands come up again and again during a search
+    static CARD_SEQUENCES: RefCell<HashMap<Vec<Card>, CardSequences>> =
+        RefCell::new(HashMap::new());
+}
+
+/// Returns every distinct card sequence that can be tried on a hare field with the given
+/// hand: any arrangement of owned cards, optionally followed by one bought card.
+fn card_sequences(cards: &[Card]) -> CardSequences {
+    CARD_SEQUENCES.with(|cache| {
+        if let Some(sequences) = cache.borrow().get(cards) {
+            return Rc::clone(sequences);
+        }
+
+        let mut sequences = Vec::new();
+
+        for card in PluginConstants::MARKET_SELECTION {
+            sequences.push(vec![card]);
+        }
+
+        for k in 0..=cards.len() {
+            for permutation in cards.iter().copied().permutations(k).unique() {
+                for card in PluginConstants::MARKET_SELECTION {
+                    let mut extended_permutaion = Vec::with_capacity(k + 1);
+                    extended_permutaion.extend_from_slice(&permutation);
+                    extended_permutaion.push(card);
+                    sequences.push(extended_permutaion);
+                }
+
+                sequences.push(permutation);
+            }
+        }
+
+        sequences.push(vec![]);
+
+        let sequences: CardSequences = sequences.into_iter().unique().collect();
+
+        let mut cache = cache.borrow_mut();
+        if cache.len() >= CARD_SEQUENCE_CACHE_LIMIT {
+            cache.clear();
+        }
+        cache.insert(cards.to_vec(), Rc::clone(&sequences));
+
+        sequences
+    })
+}
 
 #[pyclass]
 #[derive(Debug, Clone, PartialEq, Eq, PartialOrd, Hash)]
@@ -72,20 +131,17 @@ impl GameState {
         Ok(new_state)
     }
 
+    #[getter]
+    pub fn current_team(&self) -> TeamEnum {
+        self.current_player().team
+    }
+
     pub fn clone_current_player(&self) -> Hare {
-        if self.turn % 2 == 0 {
-            self.player_one.clone()
-        } else {
-            self.player_two.clone()
-        }
+        self.current_player().clone()
     }
 
     pub fn clone_other_player(&self) -> Hare {
-        if self.turn % 2 != 0 {
-            self.player_one.clone()
-        } else {
-            self.player_two.clone()
-        }
+        self.other_player().clone()
     }
 
     pub fn update_player(&mut self, player: Hare) {
@@ -116,82 +172,148 @@ impl GameState {
         moves
     }
 
+    // These actions change nothing before their rule check can fail, so the
+    // checks decide on the state directly instead of performing on a clone.
+
     fn possible_exchange_carrots_moves(&self) -> Vec<Move> {
-        let moves: Vec<Move> = vec![
-            Move::new(Action::ExchangeCarrots(ExchangeCarrots::new(-10))),
-            Move::new(Action::ExchangeCarrots(ExchangeCarrots::new(10))),
-        ];
+        let current_player = self.current_player();
 
-        moves
+        [-10, 10]
             .into_iter()
-            .filter(|m| m.perform(&mut self.clone()).is_ok())
+            .filter(|&amount| {
+                RulesEngine::can_exchange_carrots(&self.board, current_player, amount).is_ok()
+            })
+            .map(|amount| Move::new(Action::ExchangeCarrots(ExchangeCarrots::new(amount))))
             .collect()
     }
 
     fn possible_fall_back_moves(&self) -> Vec<Move> {
-        let moves: Vec<Move> = vec![Move::new(Action::FallBack(FallBack::new()))];
+        let current_player = self.current_player();
 
-        moves
-            .into_iter()
-            .filter(|m| m.perform(&mut self.clone()).is_ok())
-            .collect()
+        if current_player.get_fall_back(self).is_some()
+            && RulesEngine::has_to_eat_salad(&self.board, current_player).is_ok()
+        {
+            vec![Move::new(Action::FallBack(FallBack::new()))]
+        } else {
+            vec![]
+        }
     }
 
     fn possible_eat_salad_moves(&self) -> Vec<Move> {
-        let moves: Vec<Move> = vec![Move::new(Action::EatSalad(EatSalad::new()))];
-
-        moves
-            .into_iter()
-            .filter(|m| m.perform(&mut self.clone()).is_ok())
-            .collect()
+        if RulesEngine::can_eat_salad(&self.board, self.current_player()).is_ok() {
+            vec![Move::new(Action::EatSalad(EatSalad::new()))]
+        } else {
+            vec![]
+        }
     }
 
     fn possible_advance_moves(&self) -> Vec<Move> {
-        let current_player = self.clone_current_player();
-        let max_distance =
-            (((-1.0 + (1 + 8 * current_player.carrots) as f64).sqrt()) / 2.0) as usize;
+        let current_player = self.current_player();
+        // moving costs the triangular number of the distance, so stop at the first
+        // distance that is too expensive instead of solving for it with a square root
+        let affordable = (1..).take_while(|&distance| {
+            RulesEngine::calculates_carrots(distance) <= current_player.carrots
+        });
+        let targets = self
+            .board
+            .track
+            .get(current_player.position + 1..)
+            .unwrap_or_default();
 
         let mut moves = Vec::new();
 
-        for distance in 1..=max_distance {
-            for card in PluginConstants::MARKET_SELECTION {
-                moves.push(Move::new(Action::Advance(Advance::new(
-                    distance,
-                    vec![card],
-                ))));
-            }
-
-            for k in 0..=current_player.cards.len() {
-                for permutation in current_player.cards.iter().permutations(k).unique() {
-                    moves.push(Move::new(Action::Advance(Advance::new(
-                        distance,
-                        permutation.iter().map(|&c| *c).collect(),
-                    ))));
+        for (distance, &field) in affordable.zip(targets) {
+            let mut candidates = Vec::new();
 
+            // cards can only be bought on market fields and played on hare fields,
+            // so any other target field only allows advancing without cards
+            match field {
+                Field::Hare => {
+                    for cards in card_sequences(&current_player.cards).iter() {
+                        candidates.push(Move::new(Action::Advance(Advance::new(
+                            distance,
+                            cards.clone(),
+                        ))));
+                    }
+                }
+                Field::Market => {
                     for card in PluginConstants::MARKET_SELECTION {
-                        let mut extended_permutaion = permutation.clone();
-                        extended_permutaion.push(&card);
-                        moves.push(Move::new(Action::Advance(Advance::new(
+                        candidates.push(Move::new(Action::Advance(Advance::new(
                             distance,
-                            extended_permutaion.iter().map(|&c| *c).collect(),
+                            vec![card],
                         ))));
                     }
                 }
+                _ => {
+                    // without cards the movement rules alone decide, so no state has to be
+                    // simulated
+                    if RulesEngine::check_move_to(
+                        &self.board,
+                        distance as isize,
+                        current_player,
+                        self.other_player(),
+                        false,
+                    )
+                    .is_ok()
+                    {
+                        moves.push(Move::new(Action::Advance(Advance::new(distance, vec![]))));
+                    }
+                    continue;
+                }
             }
 
-            moves.push(Move::new(Action::Advance(Advance::new(distance, vec![]))));
+            moves.extend(
+                candidates
+                    .into_iter()
+                    .filter(|m| m.perform(&mut self.clone()).is_ok()),
+            );
         }
 
         moves
-            .into_iter()
-            .unique()
-            .filter(|m| m.perform(&mut self.clone()).is_ok())
-            .collect()
     }
 
     pub fn __repr__(&self) -> String {
         format!("{:?}", self)
     }
+
+    pub fn __eq__(&self, other: &GameState) -> bool {
+        self == other
+    }
+
+    pub fn __hash__(&self) -> u64 {
+        let mut hasher = DefaultHasher::new();
+        self.hash(&mut hasher);
+        hasher.finish()
+    }
+}
+
+impl GameState {
+    /// Borrows the player whose turn it is, for checks that do not need a copy.
+    pub fn current_player(&self) -> &Hare {
+        if self.turn % 2 == 0 {
+            &self.player_one
+        } else {
+            &self.player_two
+        }
+    }
+
+    /// Mutably borrows the player whose turn it is, to update them in place.
+    pub fn current_player_mut(&mut self) -> &mut Hare {
+        if self.turn % 2 == 0 {
+            &mut self.player_one
+        } else {
+            &mut self.player_two
+        }
+    }
+
+    /// Borrows the player who is waiting for their turn.
+    pub fn other_player(&self) -> &Hare {
+        if self.turn % 2 != 0 {
+            &self.player_one
+        } else {
+            &self.player_two
+        }
+    }
 }
 
 impl std::fmt::Display for GameState {
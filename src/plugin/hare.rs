@@ -14,6 +14,16 @@ pub enum TeamEnum {
     Two,
 }
 
+#[pymethods]
+impl TeamEnum {
+    pub fn opponent(&self) -> TeamEnum {
+        match self {
+            TeamEnum::One => TeamEnum::Two,
+            TeamEnum::Two => TeamEnum::One,
+        }
+    }
+}
+
 impl TeamEnum {
     pub fn __repr__(&self) -> String {
         format!("{:?}", self)
@@ -82,28 +92,7 @@ impl Hare {
         distance: usize,
         cards: Vec<Card>,
     ) -> Result<(), PyErr> {
-        let needed_carrots = RulesEngine::calculates_carrots(distance);
-
-        if self.carrots - needed_carrots < 0 {
-            return Err(HUIError::new_err("Not enough carrots"));
-        }
-
-        RulesEngine::can_move_to(
-            &state.board,
-            distance as isize,
-            self,
-            &state.clone_other_player(),
-            cards,
-        )?;
-
-        let new_position = self.position + distance;
-
-        self.carrots -= needed_carrots;
-        self.position = new_position;
-
-        state.update_player(self.clone());
-
-        Ok(())
+        self.advance(state, distance, !cards.is_empty())
     }
 
     pub fn exchange_carrots(&mut self, state: &mut GameState, carrots: i32) -> Result<(), PyErr> {
@@ -138,7 +127,7 @@ impl Hare {
             .board
             .get_previous_field(Field::Hedgehog, self.position)
         {
-            Some(i) if state.clone_other_player().position != i => Some(i),
+            Some(i) if state.other_player().position != i => Some(i),
             Some(_) => None,
             None => None,
         }
@@ -160,7 +149,7 @@ impl Hare {
     }
 
     pub fn is_ahead(&self, state: &GameState) -> bool {
-        self.position > state.clone_other_player().position
+        self.position > state.other_player().position
     }
 
     pub fn __repr__(&self) -> String {
@@ -168,6 +157,39 @@ impl Hare {
     }
 }
 
+impl Hare {
+    /// Like `advance_by`, but only needs to know whether any cards are played.
+    pub fn advance(
+        &mut self,
+        state: &mut GameState,
+        distance: usize,
+        with_cards: bool,
+    ) -> Result<(), PyErr> {
+        let needed_carrots = RulesEngine::calculates_carrots(distance);
+
+        if self.carrots - needed_carrots < 0 {
+            return Err(HUIError::new_err("Not enough carrots"));
+        }
+
+        RulesEngine::check_move_to(
+            &state.board,
+            distance as isize,
+            self,
+            state.other_player(),
+            with_cards,
+        )?;
+
+        let new_position = self.position + distance;
+
+        self.carrots -= needed_carrots;
+        self.position = new_position;
+
+        state.update_player(self.clone());
+
+        Ok(())
+    }
+}
+
 impl fmt::Display for Hare {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
         write!(
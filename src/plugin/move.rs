@@ -1,3 +1,6 @@
+use std::collections::hash_map::DefaultHasher;
+use std::hash::{Hash, Hasher};
+
 use pyo3::*;
 
 use super::{action::Action, game_state::GameState};
@@ -20,10 +23,8 @@ impl Move {
     pub fn perform(&self, state: &mut GameState) -> Result<(), PyErr> {
         let result = self.action.perform(state);
         if result.is_ok() {
-            let mut player = state.clone_current_player();
-            player.last_move = Some(self.clone());
+            state.current_player_mut().last_move = Some(self.clone());
             state.last_move = Some(self.clone());
-            state.update_player(player);
         }
         result
     }
@@ -31,6 +32,16 @@ impl Move {
     fn __repr__(&self) -> PyResult<String> {
         Ok(format!("Move(action={:?})", self.action))
     }
+
+    pub fn __eq__(&self, other: &Move) -> bool {
+        self == other
+    }
+
+    pub fn __hash__(&self) -> u64 {
+        let mut hasher = DefaultHasher::new();
+        self.hash(&mut hasher);
+        hasher.finish()
+    }
 }
 
 impl std::fmt::Display for Move {
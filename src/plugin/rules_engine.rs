@@ -1,7 +1,7 @@
 use pyo3::*;
 
 use super::{
-    action::{card::Card, eat_salad::EatSalad, Action},
+    action::{card::Card, Action},
     board::Board,
     errors::HUIError,
     field::Field,
@@ -9,7 +9,7 @@ use super::{
     r#move::Move,
 };
 
-#[pyclass]
+#[pyclass(frozen)]
 pub struct RulesEngine;
 
 #[pymethods]
@@ -63,16 +63,15 @@ impl RulesEngine {
     #[staticmethod]
     pub fn has_to_eat_salad(board: &Board, player: &Hare) -> Result<(), PyErr> {
         match board.get_field(player.position) {
-            Some(Field::Salad) => {
-                if player.last_move
-                    != Some(Move {
-                        action: Action::EatSalad(EatSalad::new()),
+            Some(Field::Salad)
+                if !matches!(
+                    player.last_move,
+                    Some(Move {
+                        action: Action::EatSalad(_)
                     })
-                {
-                    Err(HUIError::new_err("Cannot advance without eating salad"))
-                } else {
-                    Ok(())
-                }
+                ) =>
+            {
+                Err(HUIError::new_err("Cannot advance without eating salad"))
             }
             Some(_) => Ok(()),
             None => Ok(()),
@@ -86,6 +85,20 @@ impl RulesEngine {
         player: &Hare,
         other_player: &Hare,
         cards: Vec<Card>,
+    ) -> Result<(), PyErr> {
+        Self::check_move_to(board, distance, player, other_player, !cards.is_empty())
+    }
+}
+
+impl RulesEngine {
+    /// Like `can_move_to`, but only asks whether any cards are played,
+    /// so callers do not have to hand over a list of them.
+    pub fn check_move_to(
+        board: &Board,
+        distance: isize,
+        player: &Hare,
+        other_player: &Hare,
+        with_cards: bool,
     ) -> Result<(), PyErr> {
         if distance == 0 {
             return Err(HUIError::new_err("Advance distance cannot be 0"));
@@ -111,9 +124,9 @@ impl RulesEngine {
             Field::Hedgehog => Err(HUIError::new_err("Cannot advance on Hedgehog field")),
             Field::Salad if player.salads > 0 => Ok(()),
             Field::Salad => Err(HUIError::new_err("No salad to eat")),
-            Field::Hare if !cards.is_empty() => Ok(()),
+            Field::Hare if with_cards => Ok(()),
             Field::Hare => Err(HUIError::new_err("No card to play")),
-            Field::Market if player.carrots >= 10 && !cards.is_empty() => Ok(()),
+            Field::Market if player.carrots >= 10 && with_cards => Ok(()),
             Field::Market => Err(HUIError::new_err("Not enough carrots or no card to play")),
             Field::Goal if player.carrots <= 10 && player.salads == 0 => Ok(()),
             Field::Goal => Err(HUIError::new_err("Too many carrots or salads")),
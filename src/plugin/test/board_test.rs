@@ -11,7 +11,7 @@ mod tests {
             Field::Goal,
         ];
         let board = Board::new(fields.clone());
-        assert_eq!(board.track, fields);
+        assert_eq!(board.track(), fields);
     }
 
     #[test]
@@ -41,6 +41,9 @@ mod tests {
         assert_eq!(board.find_field(Field::Goal, 1, 4), Some(3));
         assert_eq!(board.find_field(Field::Hedgehog, 0, 4), None);
         assert_eq!(board.find_field(Field::Position1, 2, 4), None);
+        assert_eq!(board.find_field(Field::Goal, 2, usize::MAX), Some(3));
+        assert_eq!(board.find_field(Field::Hedgehog, 0, usize::MAX), None);
+        assert_eq!(board.find_field(Field::Start, 5, 8), None);
     }
 
     #[test]
@@ -77,4 +80,14 @@ mod tests {
         assert_eq!(board.get_next_field(Field::Goal, 4), None);
         assert_eq!(board.get_next_field(Field::Position1, 2), Some(3));
     }
+
+    #[test]
+    fn test_equal_boards_share_hash() {
+        let fields = vec![Field::Start, Field::Hare, Field::Salad, Field::Goal];
+        let board = Board::new(fields.clone());
+        let other = Board::new(fields);
+        assert!(board.__eq__(&other));
+        assert_eq!(board.__hash__(), other.__hash__());
+        assert!(!board.__eq__(&Board::new(vec![Field::Start, Field::Goal])));
+    }
 }
@@ -143,7 +143,7 @@ mod tests {
     fn test_invalid_field() {
         let mut state = create_test_game_state();
         let invalid_card = Card::FallBack;
-        state.board.track.clear();
+        state.board = Board::new(vec![]);
         let result = invalid_card.perform(&mut state, vec![Card::EatSalad, Card::SwapCarrots]);
         assert!(result.is_err());
     }
@@ -84,6 +84,107 @@ mod tests {
         )))));
     }
 
+    #[test]
+    fn test_possible_advance_moves_only_play_cards_on_card_fields() {
+        let state = GameState::new(
+            create_board(),
+            20,
+            create_player(
+                TeamEnum::One,
+                0,
+                vec![Card::HurryAhead, Card::EatSalad],
+                40,
+                1,
+            ),
+            create_player(TeamEnum::Two, 6, vec![], 11, 1),
+            None,
+        );
+        let moves = state.possible_moves();
+
+        assert!(moves.contains(&Move::new(Action::Advance(Advance::new(2, vec![])))));
+        assert!(moves.contains(&Move::new(Action::Advance(Advance::new(
+            5,
+            vec![Card::FallBack]
+        )))));
+        for r#move in moves {
+            if let Action::Advance(advance) = r#move.action {
+                if !advance.cards.is_empty() {
+                    let field = state.board.get_field(advance.distance);
+                    assert!(matches!(field, Some(Field::Hare) | Some(Field::Market)));
+                }
+            }
+        }
+    }
+
+    #[test]
+    fn test_equal_states_share_hash() {
+        let create_state = || {
+            GameState::new(
+                create_board(),
+                4,
+                create_player(TeamEnum::One, 2, vec![Card::EatSalad], 37, 1),
+                create_player(TeamEnum::Two, 6, vec![], 11, 1),
+                None,
+            )
+        };
+        let state = create_state();
+        let moved = state.perform_move(&state.possible_moves()[0]).unwrap();
+
+        assert!(state.__eq__(&create_state()));
+        assert_eq!(state.__hash__(), create_state().__hash__());
+        assert!(!state.__eq__(&moved));
+        assert_ne!(state.__hash__(), moved.__hash__());
+    }
+
+    #[test]
+    fn test_possible_moves_follow_state_changes() {
+        let mut state = GameState::new(
+            create_board(),
+            4,
+            create_player(TeamEnum::One, 2, vec![Card::EatSalad], 37, 1),
+            create_player(TeamEnum::Two, 6, vec![], 11, 1),
+            None,
+        );
+        let moves = state.possible_moves();
+        assert_eq!(state.possible_moves(), moves);
+
+        let mut current_player = state.clone_current_player();
+        current_player.carrots = 1;
+        state.update_player(current_player);
+
+        let fewer_moves = state.possible_moves();
+        assert_ne!(fewer_moves, moves);
+        assert!(fewer_moves.iter().all(|m| moves.contains(m)));
+    }
+
+    #[test]
+    fn test_current_team_follows_turn() {
+        let state = GameState::new(
+            create_board(),
+            4,
+            create_player(TeamEnum::One, 2, vec![], 37, 1),
+            create_player(TeamEnum::Two, 6, vec![], 11, 1),
+            None,
+        );
+        assert_eq!(state.current_team(), TeamEnum::One);
+
+        let moved = state.perform_move(&state.possible_moves()[0]).unwrap();
+        assert_eq!(moved.current_team(), TeamEnum::Two);
+        assert_eq!(moved.current_team(), moved.clone_current_player().team);
+    }
+
+    #[test]
+    fn test_equal_moves_share_hash() {
+        let advance = Move::new(Action::Advance(Advance::new(3, vec![Card::EatSalad])));
+        let same = Move::new(Action::Advance(Advance::new(3, vec![Card::EatSalad])));
+        let other = Move::new(Action::Advance(Advance::new(3, vec![Card::HurryAhead])));
+
+        assert!(advance.__eq__(&same));
+        assert_eq!(advance.__hash__(), same.__hash__());
+        assert!(!advance.__eq__(&other));
+        assert_ne!(advance.__hash__(), other.__hash__());
+    }
+
     #[test]
     fn test_correct_carrot_update() {
         let state_depth_0 = GameState::new(
@@ -0,0 +1,153 @@
+import re
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from socha.api.networking import game_client
+from socha.api.networking.game_client import GameClient, IClientHandler
+from socha.api.protocol.protocol import Data
+
+EXAMPLE = (
+    Path(__file__).resolve().parent.parent
+    / 'protocol-examples'
+    / '127.000.000.001.13050-127.000.000.001.43992.xml'
+)
+
+# The example starts with two states followed by a move request.
+FIRST_STATE, SECOND_STATE, MOVE_REQUEST = re.findall(
+    rb'<room[\s\S]+?</room>', EXAMPLE.read_bytes()
+)[:3]
+
+
+def make_client(handler):
+    with patch('socha.api.networking.xml_protocol_interface.NetworkSocket'):
+        client = GameClient(
+            'localhost', 13050, handler, None, None, None, False, False, False
+        )
+    client.network_interface.connected = True
+    return client
+
+
+def feed(client, *messages):
+    """
+    Lets the stubbed network interface hand out the given messages one after another.
+    Once they are used up, the client loop is stopped after a short grace period,
+    so moves still being sent can fail first.
+    """
+    remaining = list(messages)
+    idle = []
+
+    def wait(timeout):
+        if remaining:
+            return True
+        idle.append(None)
+        if len(idle) > 100:
+            client.running = False
+        time.sleep(0.01)
+        return False
+
+    network = client.network_interface
+    network.wait.side_effect = wait
+    network.has_buffered_message.side_effect = lambda: bool(remaining)
+    network.receive.side_effect = lambda: remaining.pop(0) if remaining else None
+
+
+def advance(distance):
+    return Data(class_value='advance', distance=distance)
+
+
+class SendTestCase(unittest.TestCase):
+    def setUp(self):
+        self.handler = MagicMock()
+        self.client = make_client(self.handler)
+        self.client.join()
+        self.sent = []
+        self.client.network_interface.send.side_effect = self.sent.append
+
+    def tearDown(self):
+        self.client._send_pool.shutdown(wait=True)
+
+    def test_moves_are_sent_in_order(self):
+        self.handler.calculate_move.side_effect = range(1, 6)
+        request = self.client._deserialize_object(MOVE_REQUEST)
+        with patch('socha.api.networking.game_client.handle_move', advance):
+            for _ in range(5):
+                self.client._on_move_request(request)
+        self.client._drain_sends()
+
+        distances = [
+            int(re.search(rb'distance="(\d+)"', shipment).group(1))
+            for shipment in self.sent
+        ]
+        self.assertEqual(distances, [1, 2, 3, 4, 5])
+
+    def test_drain_waits_for_queued_sends(self):
+        release = threading.Event()
+
+        def slow_send(shipment):
+            release.wait(1)
+            self.sent.append(shipment)
+
+        self.client.network_interface.send.side_effect = slow_send
+        self.handler.calculate_move.return_value = 1
+        request = self.client._deserialize_object(MOVE_REQUEST)
+        with patch('socha.api.networking.game_client.handle_move', advance):
+            self.client._on_move_request(request)
+            self.client._on_move_request(request)
+        self.assertEqual(self.sent, [])
+
+        threading.Timer(0.05, release.set).start()
+        self.client._drain_sends()
+        self.assertEqual(len(self.sent), 2)
+
+    def test_failing_send_stops_the_loop(self):
+        network = self.client.network_interface
+        network.send.side_effect = OSError('broken pipe')
+        network.close.side_effect = lambda: setattr(network, 'connected', False)
+        self.handler.calculate_move.return_value = 1
+        feed(self.client, MOVE_REQUEST)
+
+        with patch('socha.api.networking.game_client.handle_move', advance):
+            with self.assertRaises(SystemExit) as exit_info:
+                self.client.start()
+
+        self.assertEqual(exit_info.exception.code, 1)
+        self.handler.on_error.assert_called_once_with('broken pipe')
+        self.assertFalse(self.client.running)
+
+
+class CoalesceTestCase(unittest.TestCase):
+    def test_superseded_state_is_skipped(self):
+        handler = MagicMock(spec=IClientHandler)
+        client = make_client(handler)
+        client.join()
+        handler.calculate_move.return_value = 1
+        feed(client, FIRST_STATE, SECOND_STATE, MOVE_REQUEST)
+
+        with (
+            patch('socha.api.networking.game_client.handle_move', advance),
+            patch(
+                'socha.api.networking.game_client.message_to_state',
+                wraps=game_client.message_to_state,
+            ) as to_state,
+        ):
+            with self.assertRaises(SystemExit):
+                client.start()
+        client._send_pool.shutdown(wait=True)
+
+        # Without coalescing the second state would have been built on the last
+        # move of the first one, so the skipped state still has to supply it.
+        first = client._deserialize_object(FIRST_STATE)
+        second = client._deserialize_object(SECOND_STATE)
+        to_state.assert_called_once()
+        message, second_last_move = to_state.call_args.args
+        self.assertEqual(message, second)
+        self.assertEqual(second_last_move, game_client.message_to_last_move(first))
+
+        handler.on_update.assert_called_once()
+        (state,) = handler.on_update.call_args.args
+        self.assertEqual(list(handler.history[-1]), [state])
+        self.assertEqual(client._last_move, state.last_move)
+        handler.calculate_move.assert_called_once()
@@ -1,8 +1,25 @@
 import socket
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from socha.api.networking.network_socket import NetworkSocket
+from socha.api.networking.network_socket import MESSAGE_PATTERN, NetworkSocket
+
+
+def recv_into(*chunks):
+    """
+    Builds a recv_into side effect, that writes the given chunks one after another
+    and times out afterwards.
+    """
+    remaining = iter(chunks)
+
+    def side_effect(buffer):
+        chunk = next(remaining, None)
+        if chunk is None:
+            raise socket.timeout
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    return side_effect
 
 
 class ReceiveTestCase(unittest.TestCase):
@@ -12,22 +29,56 @@ class ReceiveTestCase(unittest.TestCase):
         self.my_obj.close = MagicMock()
 
     def test_receive_with_complete_message(self):
-        self.my_obj.socket.recv.return_value = b"<room>Test message</room>"
+        self.my_obj.socket.recv_into.side_effect = recv_into(b"<room>Test message</room>")
         result = self.my_obj.receive()
         self.assertEqual(result, b"<room>Test message</room>")
 
     def test_receive_with_incomplete_message(self):
-        self.my_obj.socket.recv.return_value = b"<room>Test message"
+        self.my_obj.socket.recv_into.side_effect = recv_into(b"<room>Test message")
         result = self.my_obj.receive()
         self.assertIsNone(result)
 
+    def test_receive_with_buffered_messages(self):
+        self.my_obj.socket.recv_into.side_effect = recv_into(
+            b'<joined roomId="1"/><room>Test message</room>'
+        )
+        self.assertEqual(self.my_obj.receive(), b'<joined roomId="1"/>')
+        self.assertEqual(self.my_obj.receive(), b"<room>Test message</room>")
+
+    def test_buffered_message_is_searched_once(self):
+        self.my_obj.buffer += b'<joined roomId="1"/><room>Test message</room>'
+        pattern = MagicMock(wraps=MESSAGE_PATTERN)
+        with patch('socha.api.networking.network_socket.MESSAGE_PATTERN', pattern):
+            self.assertTrue(self.my_obj.has_buffered_message())
+            self.assertEqual(self.my_obj.receive(), b'<joined roomId="1"/>')
+            self.assertTrue(self.my_obj.wait(0))
+            self.assertEqual(self.my_obj.receive(), b"<room>Test message</room>")
+        self.assertEqual(pattern.search.call_count, 2)
+        self.my_obj.socket.recv_into.assert_not_called()
+
+    def test_receive_with_split_message(self):
+        self.my_obj.socket.recv_into.side_effect = recv_into(
+            b"<room>Test ", b"message</room>"
+        )
+        self.assertIsNone(self.my_obj.receive())
+        self.assertEqual(self.my_obj.receive(), b"<room>Test message</room>")
+        self.assertEqual(self.my_obj.buffer, b"")
+
+    def test_receive_with_message_larger_than_chunk(self):
+        chunk_size = len(self.my_obj.chunk)
+        message = b"<room>" + b"x" * chunk_size + b"</room>"
+        self.my_obj.socket.recv_into.side_effect = recv_into(
+            message[:chunk_size], message[chunk_size:]
+        )
+        self.assertEqual(self.my_obj.receive(), message)
+
     def test_receive_with_timeout(self):
-        self.my_obj.socket.recv.side_effect = socket.timeout
+        self.my_obj.socket.recv_into.side_effect = socket.timeout
         result = self.my_obj.receive()
         self.assertIsNone(result)
 
     def test_receive_with_connection_reset_error(self):
-        self.my_obj.socket.recv.side_effect = ConnectionResetError
+        self.my_obj.socket.recv_into.side_effect = ConnectionResetError
         result = self.my_obj.receive()
         self.assertIsNone(result)
         self.my_obj.close.assert_called_once()